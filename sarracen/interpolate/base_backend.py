@@ -20,9 +20,10 @@ class BaseBackend:
                               x_max: float,
                               y_min: float,
                               y_max: float,
-                              exact: bool) -> ndarray:
+                              exact: bool,
+                              dtype: type) -> ndarray:
         """ Interpolate 2D data to a 2D grid of pixels."""
-        return zeros((y_pixels, x_pixels))
+        return zeros((y_pixels, x_pixels), dtype=dtype)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray,
@@ -38,9 +39,11 @@ class BaseBackend:
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> Tuple[ndarray, ndarray]:
+                                  exact: bool,
+                                  dtype: type) -> Tuple[ndarray, ndarray]:
         """ Interpolate 2D vector data to a pair of 2D pixel grids. """
-        return zeros((y_pixels, x_pixels)), zeros((y_pixels, x_pixels))
+        return (zeros((y_pixels, x_pixels), dtype=dtype),
+                zeros((y_pixels, x_pixels), dtype=dtype))
 
     @staticmethod
     def interpolate_2d_line(x: ndarray,
@@ -88,9 +91,10 @@ class BaseBackend:
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> ndarray:
+                                  exact: bool,
+                                  dtype: type) -> ndarray:
         """ Interpolate 3D data to a 2D pixel grid using column projection."""
-        return zeros((y_pixels, x_pixels))
+        return zeros((y_pixels, x_pixels), dtype=dtype)
 
     @staticmethod
     def interpolate_3d_projection_vec(x: ndarray,
@@ -106,10 +110,12 @@ class BaseBackend:
                                       x_max: float,
                                       y_min: float,
                                       y_max: float,
-                                      exact: bool) -> Tuple[ndarray, ndarray]:
+                                      exact: bool,
+                                      dtype: type) -> Tuple[ndarray, ndarray]:
         """ Interpolate 3D vector data to a pair of 2D pixel grids using
         column projection."""
-        return zeros((y_pixels, x_pixels)), zeros((y_pixels, x_pixels))
+        return (zeros((y_pixels, x_pixels), dtype=dtype),
+                zeros((y_pixels, x_pixels), dtype=dtype))
 
     @staticmethod
     def interpolate_3d_cross(x: ndarray,
@@ -125,12 +131,13 @@ class BaseBackend:
                              x_min: float,
                              x_max: float,
                              y_min: float,
-                             y_max: float) -> ndarray:
+                             y_max: float,
+                             dtype: type) -> ndarray:
         """
         Interpolate 3D data to a pair of 2D pixel grids using a 3D
         cross-section at a specific z value.
         """
-        return zeros((y_pixels, x_pixels))
+        return zeros((y_pixels, x_pixels), dtype=dtype)
 
     @staticmethod
     def interpolate_3d_cross_vec(x: ndarray,
@@ -147,12 +154,14 @@ class BaseBackend:
                                  x_min: float,
                                  x_max: float,
                                  y_min: float,
-                                 y_max: float) -> Tuple[ndarray, ndarray]:
+                                 y_max: float,
+                                 dtype: type) -> Tuple[ndarray, ndarray]:
         """
         Interpolate 3D vector data to a pair of 2D pixel grids using a 3D
         cross-section at a specific z value.
         """
-        return zeros((y_pixels, x_pixels)), zeros((y_pixels, x_pixels))
+        return (zeros((y_pixels, x_pixels), dtype=dtype),
+                zeros((y_pixels, x_pixels), dtype=dtype))
 
     @staticmethod
     def interpolate_3d_grid(x: ndarray,
@@ -170,8 +179,9 @@ class BaseBackend:
                             y_min: float,
                             y_max: float,
                             z_min: float,
-                            z_max: float) -> ndarray:
+                            z_max: float,
+                            dtype: type) -> ndarray:
         """
         Interpolate 3D data to a 3D grid of pixels.
         """
-        return zeros((z_pixels, y_pixels, x_pixels))
+        return zeros((z_pixels, y_pixels, x_pixels), dtype=dtype)
@@ -1,3 +1,4 @@
+import math
 from typing import Tuple
 
 from numba import njit, prange, get_num_threads
@@ -8,6 +9,301 @@ import numpy as np
 from ..interpolate.base_backend import BaseBackend
 from ..kernels.cubic_spline_exact import line_int, surface_int
 
+# Number of pixels in each image tile rendered by a single thread, chosen so
+# that a tile stays resident in cache while its particles are drawn.
+_TILE_PIXELS = 128 * 128
+
+# Number of row bands to aim for per thread. Particles are rarely spread
+# evenly across an image, so splitting the work more finely than one band per
+# thread lets the threads share out the densely populated rows.
+_BANDS_PER_THREAD = 8
+
+
+@njit(cache=True)
+def _bucket_order(bucket: ndarray, n_buckets: int) -> ndarray:
+    """ Stable counting sort of particle indices by bucket number.
+
+    Parameters
+    ----------
+    bucket: ndarray
+        Bucket number of each particle, in the range [0, n_buckets).
+    n_buckets: int
+        Total number of buckets.
+
+    Returns
+    -------
+    ndarray
+        Particle indices, ordered by bucket.
+    """
+    offsets = np.zeros(n_buckets + 1, dtype=np.int64)
+    for i in range(bucket.size):
+        offsets[bucket[i] + 1] += 1
+    offsets = np.cumsum(offsets)
+
+    order = np.empty(bucket.size, dtype=np.int64)
+    for i in range(bucket.size):
+        order[offsets[bucket[i]]] = i
+        offsets[bucket[i]] += 1
+
+    return order
+
+
+@njit(cache=True)
+def _tile_particles(first: ndarray,
+                    last: ndarray,
+                    n_tiles: int) -> Tuple[ndarray, ndarray]:
+    """ Group particle indices by the image tiles that they overlap.
+
+    Parameters
+    ----------
+    first, last: ndarray
+        Index of the first and last tile overlapped by each particle.
+    n_tiles: int
+        Total number of tiles.
+
+    Returns
+    -------
+    offsets: ndarray
+        Offsets into `particles`, such that the particles overlapping tile t
+        are particles[offsets[t]:offsets[t + 1]].
+    particles: ndarray
+        Particle indices grouped by tile, in their original order within
+        each tile.
+    """
+    offsets = np.zeros(n_tiles + 1, dtype=np.int64)
+    for i in range(first.size):
+        for t in range(first[i], last[i] + 1):
+            offsets[t + 1] += 1
+    offsets = np.cumsum(offsets)
+
+    fill = offsets[:-1].copy()
+    particles = np.empty(offsets[-1], dtype=np.int64)
+    for i in range(first.size):
+        for t in range(first[i], last[i] + 1):
+            particles[fill[t]] = i
+            fill[t] += 1
+
+    return offsets, particles
+
+
+@njit(cache=True)
+def _row_bands(ipixmin: ndarray,
+               ipixmax: ndarray,
+               jpixmin: ndarray,
+               jpixmax: ndarray,
+               y_pixels: int,
+               max_rows: int,
+               n_bands: int) -> Tuple[ndarray, ndarray, ndarray]:
+    """ Split the rows of an image into bands holding similar amounts of work.
+
+    The work in each row is estimated as the number of pixels drawn in it,
+    summed over all particles. Rows are assigned to bands in order, starting
+    a new band once the current one holds its share of the total work, or
+    once it reaches `max_rows` rows.
+
+    Parameters
+    ----------
+    ipixmin, ipixmax, jpixmin, jpixmax: ndarray
+        Range of pixels covered by each particle, which must be non-empty.
+    y_pixels: int
+        Number of rows in the image.
+    max_rows: int
+        Maximum number of rows in a band.
+    n_bands: int
+        Number of bands to aim for.
+
+    Returns
+    -------
+    edges: ndarray
+        First row of each band, followed by `y_pixels`, such that band b
+        spans rows edges[b]:edges[b + 1].
+    band_of_row: ndarray
+        Band containing each row.
+    band_work: ndarray
+        Estimated work in each band.
+    """
+    # pixels drawn in each row, accumulated from the first and last row of
+    # each particle
+    work = np.zeros(y_pixels + 1, dtype=np.int64)
+    for i in range(jpixmin.size):
+        work[jpixmin[i]] += ipixmax[i] - ipixmin[i]
+        work[jpixmax[i]] -= ipixmax[i] - ipixmin[i]
+    work = np.cumsum(work)
+    target = work[:y_pixels].sum() / n_bands
+
+    band_of_row = np.empty(y_pixels, dtype=np.int64)
+    band, start, band_work = 0, 0, 0
+    for j in range(y_pixels):
+        if j > start and (j - start >= max_rows or band_work >= target):
+            band, start, band_work = band + 1, j, 0
+        band_of_row[j] = band
+        band_work += work[j]
+
+    edges = np.empty(band + 2, dtype=np.int64)
+    edges[0], edges[-1] = 0, y_pixels
+    band_work = np.zeros(band + 1, dtype=np.int64)
+    for j in range(y_pixels):
+        if j > 0 and band_of_row[j] != band_of_row[j - 1]:
+            edges[band_of_row[j]] = j
+        band_work[band_of_row[j]] += work[j]
+
+    return edges, band_of_row, band_work
+
+
+@njit(cache=True)
+def _split_work(work: ndarray, n_parts: int) -> ndarray:
+    """ Split a sequence of work items into contiguous runs of similar total
+    work.
+
+    Parameters
+    ----------
+    work: ndarray
+        Work in each item.
+    n_parts: int
+        Number of runs to split the items into.
+
+    Returns
+    -------
+    ndarray
+        First item of each run, followed by the number of items, such that
+        run p covers items bounds[p]:bounds[p + 1].
+    """
+    cumulative = np.cumsum(work)
+    total = cumulative[-1] if work.size > 0 else 0
+    bounds = np.empty(n_parts + 1, dtype=np.int64)
+    for p in range(n_parts + 1):
+        bounds[p] = np.searchsorted(cumulative, total * p / n_parts)
+    bounds[0], bounds[-1] = 0, work.size
+    return bounds
+
+
+@njit(inline='always')
+def _pixel_range(pos: ndarray,
+                 rad: ndarray,
+                 pos_min: float,
+                 pixwidth: float,
+                 pixels: int) -> Tuple[ndarray, ndarray]:
+    """ Range of pixels along one axis covered by each particle.
+
+    Parameters
+    ----------
+    pos: ndarray
+        Particle positions along the axis.
+    rad: ndarray
+        Radius of the kernel support of each particle.
+    pos_min: float
+        Position of the lower edge of the first pixel.
+    pixwidth: float
+        Width of each pixel.
+    pixels: int
+        Number of pixels along the axis.
+
+    Returns
+    -------
+    pixmin, pixmax: ndarray
+        First pixel, and one past the last pixel, covered by each particle,
+        clipped to the image.
+    """
+    pixmin = np.clip(np.rint((pos - rad - pos_min) / pixwidth),
+                     0, pixels).astype(np.int64)
+    pixmax = np.clip(np.rint((pos + rad - pos_min) / pixwidth),
+                     0, pixels).astype(np.int64)
+    return pixmin, pixmax
+
+
+@njit(inline='always')
+def _block_order(keep: ndarray,
+                 ipixmin: ndarray,
+                 jpixmin: ndarray,
+                 x_pixels: int,
+                 y_pixels: int) -> ndarray:
+    """ Indices of kept particles, grouped by the 32x32 block of pixels that
+    each starts in, so that consecutive particles write to nearby parts of
+    the image.
+
+    Parameters
+    ----------
+    keep: ndarray
+        Boolean mask of the particles to render.
+    ipixmin, jpixmin: ndarray
+        First pixel covered by each particle in the x & y directions.
+    x_pixels, y_pixels: int
+        Number of pixels in the image in the x & y directions.
+
+    Returns
+    -------
+    ndarray
+        Indices of the kept particles, ordered by pixel block.
+    """
+    keep = np.nonzero(keep)[0]
+    bucket = (jpixmin[keep] // 32) * (x_pixels // 32 + 1) \
+        + ipixmin[keep] // 32
+    return keep[_bucket_order(bucket, (y_pixels // 32 + 1)
+                              * (x_pixels // 32 + 1))]
+
+
+@njit(inline='always')
+def _draw_particle(image: ndarray,
+                   x: float,
+                   y: float,
+                   dz: float,
+                   term: float,
+                   inv_h2: float,
+                   ipmin: int,
+                   ipmax: int,
+                   jpmin: int,
+                   jpmax: int,
+                   x_min: float,
+                   y_min: float,
+                   pixwidthx: float,
+                   pixwidthy: float,
+                   kernel_radius2: float,
+                   weight_function: CPUDispatcher,
+                   n_dims: int) -> None:
+    """ Add the contribution of one particle to a block of image pixels.
+
+    Parameters
+    ----------
+    image: ndarray
+        2D image, indexed as [y, x], that the contribution is added to.
+    x, y: float
+        Position of the particle.
+    dz: float
+        Distance of the particle from the image plane.
+    term: float
+        Weight of the particle, divided by h^n_dims.
+    inv_h2: float
+        Inverse square of the particle smoothing length.
+    ipmin, ipmax, jpmin, jpmax: int
+        Range of pixels to draw into, which must lie within the image.
+    x_min, y_min: float
+        Position of the lower edges of the image.
+    pixwidthx, pixwidthy: float
+        Width of each pixel in the x & y directions.
+    kernel_radius2: float
+        Square of the kernel radius, in units of h.
+    weight_function: CPUDispatcher
+        Kernel weight function.
+    n_dims: int
+        Number of dimensions passed to the weight function.
+    """
+    # precalculate differences in the x-direction (optimization)
+    dx2i = ((x_min + (np.arange(ipmin, ipmax) + 0.5) * pixwidthx - x)**2
+            + dz**2) * inv_h2
+
+    # calculate contributions at pixels i, j from particle at x, y
+    for jp in range(jpmin, jpmax):
+        dy = y_min + (jp + 0.5) * pixwidthy - y
+        dy2 = dy * dy * inv_h2
+
+        for ipix in range(ipmax - ipmin):
+            # only take the square root inside the kernel support
+            q2 = dx2i[ipix] + dy2
+            if q2 > kernel_radius2:
+                continue
+            wab = weight_function(math.sqrt(q2), n_dims)
+            image[jp, ipix + ipmin] += term * wab
+
 
 class CPUBackend(BaseBackend):
 
@@ -24,14 +320,16 @@ class CPUBackend(BaseBackend):
                               x_max: float,
                               y_min: float,
                               y_max: float,
-                              exact: bool) -> ndarray:
+                              exact: bool,
+                              dtype: type) -> ndarray:
         if exact:
             return CPUBackend._exact_2d_render(x, y, weight, h, x_pixels,
                                                y_pixels, x_min, x_max,
-                                               y_min, y_max)
+                                               y_min, y_max, dtype)
         return CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   dtype)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray,
@@ -47,20 +345,23 @@ class CPUBackend(BaseBackend):
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> Tuple[ndarray, ndarray]:
+                                  exact: bool,
+                                  dtype: type) -> Tuple[ndarray, ndarray]:
         if exact:
             return (CPUBackend._exact_2d_render(x, y, weight_x, h, x_pixels,
                                                 y_pixels, x_min, x_max,
-                                                y_min, y_max),
+                                                y_min, y_max, dtype),
                     CPUBackend._exact_2d_render(x, y, weight_y, h, x_pixels,
                                                 y_pixels, x_min, x_max,
-                                                y_min, y_max))
+                                                y_min, y_max, dtype))
         return (CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2),
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype),
                 CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2))
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype))
 
     @staticmethod
     def interpolate_2d_line(x: ndarray,
@@ -110,14 +411,16 @@ class CPUBackend(BaseBackend):
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> ndarray:
+                                  exact: bool,
+                                  dtype: type) -> ndarray:
         if exact:
             return CPUBackend._exact_3d_project(x, y, weight, h, x_pixels,
                                                 y_pixels, x_min, x_max,
-                                                y_min, y_max)
+                                                y_min, y_max, dtype)
         return CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   dtype)
 
     @staticmethod
     def interpolate_3d_projection_vec(x: ndarray,
@@ -133,20 +436,23 @@ class CPUBackend(BaseBackend):
                                       x_max: float,
                                       y_min: float,
                                       y_max: float,
-                                      exact: bool) -> Tuple[ndarray, ndarray]:
+                                      exact: bool,
+                                      dtype: type) -> Tuple[ndarray, ndarray]:
         if exact:
             return (CPUBackend._exact_3d_project(x, y, weight_x, h, x_pixels,
                                                  y_pixels, x_min, x_max,
-                                                 y_min, y_max),
+                                                 y_min, y_max, dtype),
                     CPUBackend._exact_3d_project(x, y, weight_y, h, x_pixels,
                                                  y_pixels, x_min, x_max,
-                                                 y_min, y_max))
+                                                 y_min, y_max, dtype))
         return (CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2),
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype),
                 CPUBackend._fast_2d(x, y, np.zeros(y.size), 0, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2))
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype))
 
     @staticmethod
     def interpolate_3d_cross(x: ndarray,
@@ -162,10 +468,12 @@ class CPUBackend(BaseBackend):
                              x_min: float,
                              x_max: float,
                              y_min: float,
-                             y_max: float) -> ndarray:
+                             y_max: float,
+                             dtype: type) -> ndarray:
         return CPUBackend._fast_2d(x, y, z, z_slice, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 3)
+                                   y_pixels, x_min, x_max, y_min, y_max, 3,
+                                   dtype)
 
     @staticmethod
     def interpolate_3d_cross_vec(x: ndarray,
@@ -182,13 +490,16 @@ class CPUBackend(BaseBackend):
                                  x_min: float,
                                  x_max: float,
                                  y_min: float,
-                                 y_max: float) -> Tuple[ndarray, ndarray]:
+                                 y_max: float,
+                                 dtype: type) -> Tuple[ndarray, ndarray]:
         return (CPUBackend._fast_2d(x, y, z, z_slice, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 3),
+                                    y_pixels, x_min, x_max, y_min, y_max, 3,
+                                    dtype),
                 CPUBackend._fast_2d(x, y, z, z_slice, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 3))
+                                    y_pixels, x_min, x_max, y_min, y_max, 3,
+                                    dtype))
 
     @staticmethod
     def interpolate_3d_grid(x: ndarray,
@@ -206,18 +517,12 @@ class CPUBackend(BaseBackend):
                             y_min: float,
                             y_max: float,
                             z_min: float,
-                            z_max: float) -> ndarray:
-        image = np.zeros((z_pixels, y_pixels, x_pixels))
-        pixwidthz = (z_max - z_min) / z_pixels
-
-        for z_i in np.arange(z_pixels):
-            z_val = z_min + (z_i + 0.5) * pixwidthz
-            image[z_i] = CPUBackend._fast_2d(x, y, z, z_val, weight, h,
-                                             weight_function, kernel_radius,
-                                             x_pixels, y_pixels, x_min, x_max,
-                                             y_min, y_max, 3)
-
-        return image
+                            z_max: float,
+                            dtype: type) -> ndarray:
+        return CPUBackend._fast_3d_grid(x, y, z, weight, h, weight_function,
+                                        kernel_radius, x_pixels, y_pixels,
+                                        z_pixels, x_min, x_max, y_min, y_max,
+                                        z_min, z_max, dtype)
 
     # Underlying CPU numba-compiled code for interpolation to a 2D grid. Used
     # in interpolation of 2D data, and column integration / cross-sections of
@@ -239,8 +544,8 @@ class CPUBackend(BaseBackend):
                  x_max: float,
                  y_min: float,
                  y_max: float,
-                 n_dims: int) -> ndarray:
-        output = np.zeros((y_pixels, x_pixels))
+                 n_dims: int,
+                 dtype: type) -> ndarray:
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
         if not n_dims == 2:
@@ -249,66 +554,148 @@ class CPUBackend(BaseBackend):
             dz = np.zeros(x_data.size)
 
         term = w_data / h_data ** n_dims
+        kernel_radius2 = kernel_radius ** 2
 
-        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels))
-
-        # thread safety:
-        # each thread has its own grid, which are combined after interpolation
-        for thread in prange(get_num_threads()):
-            block_size = x_data.size / get_num_threads()
-            range_start = int(thread * block_size)
-            range_end = int((thread + 1) * block_size)
-
-            # iterate through the indexes of non-filtered particles
-            for i in range(range_start, range_end):
-                if np.abs(dz[i]) >= kernel_radius * h_data[i]:
-                    continue
+        # radius of the kernel support within this slice, which is zero for
+        # particles that do not intersect it
+        if n_dims == 2:
+            rad = (kernel_radius * h_data).astype(np.float64)
+        else:
+            rad = np.sqrt(np.maximum((kernel_radius * h_data)**2 - dz**2, 0))
+
+        # determine pixels that each particle contributes to
+        ipixmin, ipixmax = _pixel_range(x_data, rad, x_min, pixwidthx,
+                                        x_pixels)
+        jpixmin, jpixmax = _pixel_range(y_data, rad, y_min, pixwidthy,
+                                        y_pixels)
+
+        # discard particles that do not contribute to any pixel, either
+        # because their patch is empty or because their weight is zero
+        order = _block_order((ipixmax > ipixmin) & (jpixmax > jpixmin)
+                             & (term != 0), ipixmin, jpixmin,
+                             x_pixels, y_pixels)
+        x_data, y_data = x_data[order], y_data[order]
+        dz, term = dz[order], term[order]
+        ipixmin, ipixmax = ipixmin[order], ipixmax[order]
+        jpixmin, jpixmax = jpixmin[order], jpixmax[order]
+        inv_h2 = 1 / h_data[order] ** 2
+
+        # the image is split into bands of rows that are small enough to stay
+        # in cache, and which hold similar numbers of particle pixels so that
+        # densely populated regions are shared between threads. each band is
+        # drawn by a single thread, so no per-thread copies of the image are
+        # needed.
+        n_threads = get_num_threads()
+        edges, band_of_row, band_work = \
+            _row_bands(ipixmin, ipixmax, jpixmin, jpixmax, y_pixels,
+                       max(1, _TILE_PIXELS // x_pixels),
+                       _BANDS_PER_THREAD * n_threads)
+        offsets, particles = _tile_particles(band_of_row[jpixmin],
+                                             band_of_row[jpixmax - 1],
+                                             edges.size - 1)
+
+        # each thread draws a contiguous run of bands holding its share of
+        # the work, rather than relying on prange to divide them evenly
+        thread_bands = _split_work(band_work, n_threads)
+
+        output = np.zeros((y_pixels, x_pixels), dtype=dtype)
+
+        for thread in prange(n_threads):
+            for band in range(thread_bands[thread], thread_bands[thread + 1]):
+                band_min, band_max = edges[band], edges[band + 1]
+
+                # iterate through the particles overlapping this band
+                for n in range(offsets[band], offsets[band + 1]):
+                    i = particles[n]
+
+                    # the bounds are already clipped, but max() lets numba
+                    # drop its negative index handling in the loops below
+                    ipmin, ipmax = max(ipixmin[i], 0), ipixmax[i]
+                    jpmin = max(jpixmin[i], band_min, 0)
+                    jpmax = min(jpixmax[i], band_max)
+
+                    _draw_particle(output, x_data[i], y_data[i], dz[i],
+                                   term[i], inv_h2[i], ipmin, ipmax, jpmin,
+                                   jpmax, x_min, y_min, pixwidthx, pixwidthy,
+                                   kernel_radius2, weight_function, n_dims)
 
-                rad = kernel_radius * h_data[i]
+        return output
 
-                # determine pixels that this particle contributes to
-                ipixmin = int(np.rint((x_data[i] - rad - x_min) / pixwidthx))
-                jpixmin = int(np.rint((y_data[i] - rad - y_min) / pixwidthy))
-                ipixmax = int(np.rint((x_data[i] + rad - x_min) / pixwidthx))
-                jpixmax = int(np.rint((y_data[i] + rad - y_min) / pixwidthy))
+    # Underlying CPU numba-compiled code for interpolation of 3D data to a 3D
+    # grid. Equivalent to a cross-section through every z slice of the grid,
+    # but performed in one compiled call that is parallel over slices.
+    @staticmethod
+    @njit(parallel=True, fastmath=True)
+    def _fast_3d_grid(x_data: ndarray,
+                      y_data: ndarray,
+                      z_data: ndarray,
+                      w_data: ndarray,
+                      h_data: ndarray,
+                      weight_function: CPUDispatcher,
+                      kernel_radius: float,
+                      x_pixels: int,
+                      y_pixels: int,
+                      z_pixels: int,
+                      x_min: float,
+                      x_max: float,
+                      y_min: float,
+                      y_max: float,
+                      z_min: float,
+                      z_max: float,
+                      dtype: type) -> ndarray:
+        pixwidthx = (x_max - x_min) / x_pixels
+        pixwidthy = (y_max - y_min) / y_pixels
+        pixwidthz = (z_max - z_min) / z_pixels
 
-                if ipixmax < 0 or ipixmin > x_pixels:
-                    continue
-                if jpixmax < 0 or jpixmin > y_pixels:
+        term = w_data / h_data ** 3
+        kernel_radius2 = kernel_radius ** 2
+        rad = (kernel_radius * h_data).astype(np.float64)
+
+        # determine the pixels and slices that each particle contributes to
+        ipixmin, ipixmax = _pixel_range(x_data, rad, x_min, pixwidthx,
+                                        x_pixels)
+        jpixmin, jpixmax = _pixel_range(y_data, rad, y_min, pixwidthy,
+                                        y_pixels)
+        kpixmin, kpixmax = _pixel_range(z_data, rad, z_min, pixwidthz,
+                                        z_pixels)
+
+        # discard particles that do not contribute to any pixel
+        order = _block_order((ipixmax > ipixmin) & (jpixmax > jpixmin)
+                             & (kpixmax > kpixmin) & (term != 0),
+                             ipixmin, jpixmin, x_pixels, y_pixels)
+        x_data, y_data, z_data = x_data[order], y_data[order], z_data[order]
+        term, inv_h2 = term[order], 1 / h_data[order] ** 2
+        rad2 = rad[order] ** 2
+        offsets, particles = _tile_particles(kpixmin[order],
+                                             kpixmax[order] - 1, z_pixels)
+
+        output = np.zeros((z_pixels, y_pixels, x_pixels), dtype=dtype)
+
+        # each slice is drawn by a single thread
+        for kpix in prange(z_pixels):
+            z_slice = z_min + (kpix + 0.5) * pixwidthz
+
+            for n in range(offsets[kpix], offsets[kpix + 1]):
+                i = particles[n]
+                dz = z_slice - z_data[i]
+                if dz ** 2 >= rad2[i]:
                     continue
 
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
-
-                # precalculate differences in the x-direction (optimization)
-                dx2i = ((x_min + (np.arange(ipixmin, ipixmax) + 0.5)
-                         * pixwidthx - x_data[i])**2 + dz[i]**2) / h_data[i]**2
-
-                # determine differences in the y-direction
-                ypix = y_min + (np.arange(jpixmin, jpixmax) + 0.5) * pixwidthy
-                dy = ypix - y_data[i]
-                dy2 = dy * dy * (1 / (h_data[i] ** 2))
-
-                # calculate contributions at pixels i, j from particle at x, y
-                q2 = dx2i + dy2.reshape(len(dy2), 1)
-
-                for jpix in range(jpixmax - jpixmin):
-                    for ipix in range(ipixmax - ipixmin):
-                        if np.sqrt(q2[jpix][ipix]) > kernel_radius:
-                            continue
-                        wab = weight_function(np.sqrt(q2[jpix][ipix]), n_dims)
-                        jp = jpix + jpixmin
-                        ip = ipix + ipixmin
-                        output_local[thread][jp, ip] += term[i] * wab
-
-        for i in range(get_num_threads()):
-            output += output_local[i]
+                # radius of the kernel support within this slice
+                srad = math.sqrt(rad2[i] - dz ** 2)
+                ipmin = max(int(np.rint((x_data[i] - srad - x_min)
+                                        / pixwidthx)), 0)
+                jpmin = max(int(np.rint((y_data[i] - srad - y_min)
+                                        / pixwidthy)), 0)
+                ipmax = min(int(np.rint((x_data[i] + srad - x_min)
+                                        / pixwidthx)), x_pixels)
+                jpmax = min(int(np.rint((y_data[i] + srad - y_min)
+                                        / pixwidthy)), y_pixels)
+
+                _draw_particle(output[kpix], x_data[i], y_data[i], dz,
+                               term[i], inv_h2[i], ipmin, ipmax, jpmin, jpmax,
+                               x_min, y_min, pixwidthx, pixwidthy,
+                               kernel_radius2, weight_function, 3)
 
         return output
 
@@ -325,8 +712,10 @@ class CPUBackend(BaseBackend):
                          x_min: float,
                          x_max: float,
                          y_min: float,
-                         y_max: float) -> ndarray:
-        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels))
+                         y_max: float,
+                         dtype: type) -> ndarray:
+        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels),
+                                dtype=dtype)
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
 
@@ -439,10 +828,12 @@ class CPUBackend(BaseBackend):
                         if ipix < ipixmax - 1:
                             output_local[thread, jpix, ipix+1] -= term[i] * wab
 
-        output = np.zeros((y_pixels, x_pixels))
+        output = np.zeros((y_pixels, x_pixels), dtype=dtype)
 
-        for i in range(get_num_threads()):
-            output += output_local[i]
+        # combine the per-thread images, reducing each row in parallel
+        for jpix in prange(y_pixels):
+            for thread in range(get_num_threads()):
+                output[jpix] += output_local[thread, jpix]
 
         return output
 
@@ -483,18 +874,18 @@ class CPUBackend(BaseBackend):
             + yint**2 - (kernel_radius * h_data)**2
         det = bb ** 2 - 4 * aa * det
 
-        # create a filter for particles that do not contribute
+        # filter out particles that do not contribute, once, rather than
+        # re-indexing the filter for every particle below
         filter = det >= 0
-        det = np.sqrt(det)
+        x_data, y_data, h_data = x_data[filter], y_data[filter], h_data[filter]
+        term, bb, det = term[filter], bb[filter], np.sqrt(det[filter])
 
         output = np.zeros(pixels)
 
         # the starting and ending x coordinates of the lines intersections with
         # a particle's smoothing circle
-        rstart = ((-bb[filter] - det[filter])
-                  / (2 * aa)).clip(a_min=x1, a_max=x2)
-        rend = ((-bb[filter] + det[filter])
-                / (2 * aa)).clip(a_min=x1, a_max=x2)
+        rstart = ((-bb - det) / (2 * aa)).clip(a_min=x1, a_max=x2)
+        rend = ((-bb + det) / (2 * aa)).clip(a_min=x1, a_max=x2)
 
         # start and end distances that are within a particle's smoothing circle
         rstart = np.sqrt((rstart - x1)**2
@@ -502,8 +893,10 @@ class CPUBackend(BaseBackend):
         rend = np.sqrt((rend - x1)**2 + (((gradient * rend + yint) - y1)**2))
 
         # the maximum and minimum pixels that each particle contributes to.
-        ipixmin = np.rint(rstart / pixwidth).clip(a_min=0, a_max=pixels)
-        ipixmax = np.rint(rend / pixwidth).clip(a_min=0, a_max=pixels)
+        ipixmin = np.rint(rstart / pixwidth).clip(a_min=0, a_max=pixels) \
+            .astype(np.int32)
+        ipixmax = np.rint(rend / pixwidth).clip(a_min=0, a_max=pixels) \
+            .astype(np.int32)
 
         output_local = np.zeros((get_num_threads(), pixels))
 
@@ -511,26 +904,26 @@ class CPUBackend(BaseBackend):
         # each thread has its own grid, which are combined after interpolation
         for thread in prange(get_num_threads()):
 
-            block_size = len(x_data[filter]) / get_num_threads()
-            range_start = thread * block_size
-            range_end = (thread + 1) * block_size
+            block_size = x_data.size / get_num_threads()
+            range_start = int(thread * block_size)
+            range_end = int((thread + 1) * block_size)
 
             # iterate through the indices of all non-filtered particles
             for i in range(range_start, range_end):
                 # determine contributions to all pixels for this particle
-                xpix = x1 + (np.arange(int(ipixmin[i]), int(ipixmax[i]))
+                xpix = x1 + (np.arange(ipixmin[i], ipixmax[i])
                              + 0.5) * xpixwidth
                 ypix = gradient * xpix + yint
-                dy = ypix - y_data[filter][i]
-                dx = xpix - x_data[filter][i]
+                dy = ypix - y_data[i]
+                dx = xpix - x_data[i]
 
-                q2 = (dx**2 + dy**2) / h_data[filter][i]**2
+                q2 = (dx**2 + dy**2) / h_data[i]**2
                 wab = weight_function(np.sqrt(q2), 2)
 
                 # add contributions to output total
-                for ipix in range(int(ipixmax[i]) - int(ipixmin[i])):
-                    ip = ipix + int(ipixmin[i])
-                    output_local[thread][ip] += term[filter][i] * wab[ipix]
+                for ipix in range(ipixmax[i] - ipixmin[i]):
+                    ip = ipix + ipixmin[i]
+                    output_local[thread][ip] += term[i] * wab[ipix]
 
         for i in range(get_num_threads()):
             output += output_local[i]
@@ -578,22 +971,18 @@ class CPUBackend(BaseBackend):
                 if delta < 0:
                     continue
 
-                d1 = -(ux * dx + uy * dy + uz * dz) - np.sqrt(delta)
-                d2 = -(ux * dx + uy * dy + uz * dz) + np.sqrt(delta)
+                sqrt_delta = math.sqrt(delta)
+                d1 = -(ux * dx + uy * dy + uz * dz) - sqrt_delta
+                d2 = -(ux * dx + uy * dy + uz * dz) + sqrt_delta
 
                 pixmin = min(max(0, round((d1 / length) * pixels)), pixels)
                 pixmax = min(max(0, round((d2 / length) * pixels)), pixels)
 
-                xpix = x1 + (np.arange(pixmin, pixmax)
-                             + 0.5) * (x2 - x1) / pixels
-                ypix = y1 + (np.arange(pixmin, pixmax)
-                             + 0.5) * (y2 - y1) / pixels
-                zpix = z1 + (np.arange(pixmin, pixmax)
-                             + 0.5) * (z2 - z1) / pixels
-
-                xdiff = xpix - x_data[i]
-                ydiff = ypix - y_data[i]
-                zdiff = zpix - z_data[i]
+                # pixel centres along the line, shared by all three axes
+                centres = np.arange(pixmin, pixmax) + 0.5
+                xdiff = x1 + centres * (x2 - x1) / pixels - x_data[i]
+                ydiff = y1 + centres * (y2 - y1) / pixels - y_data[i]
+                zdiff = z1 + centres * (z2 - z1) / pixels - z_data[i]
 
                 q2 = (xdiff**2 + ydiff**2 + zdiff**2) / h_data[i]**2
                 wab = weight_function(np.sqrt(q2), 3)
@@ -619,8 +1008,10 @@ class CPUBackend(BaseBackend):
                           x_min: float,
                           x_max: float,
                           y_min: float,
-                          y_max: float) -> ndarray:
-        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels))
+                          y_max: float,
+                          dtype: type) -> ndarray:
+        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels),
+                                dtype=dtype)
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
 
@@ -712,9 +1103,11 @@ class CPUBackend(BaseBackend):
 
                             output_local[thread, jpix, ipix] += term[i] * wab
 
-        output = np.zeros((y_pixels, x_pixels))
+        output = np.zeros((y_pixels, x_pixels), dtype=dtype)
 
-        for i in range(get_num_threads()):
-            output += output_local[i]
+        # combine the per-thread images, reducing each row in parallel
+        for jpix in prange(y_pixels):
+            for thread in range(get_num_threads()):
+                output[jpix] += output_local[thread, jpix]
 
         return output
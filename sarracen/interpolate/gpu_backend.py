@@ -1,5 +1,6 @@
 import math
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, Tuple
 
 import numpy as np
 from numba import cuda
@@ -25,14 +26,16 @@ class GPUBackend(BaseBackend):
                               x_max: float,
                               y_min: float,
                               y_max: float,
-                              exact: bool) -> ndarray:
+                              exact: bool,
+                              dtype: type) -> ndarray:
         if exact:
             return GPUBackend._exact_2d_render(x, y, weight, h, x_pixels,
                                                y_pixels, x_min, x_max,
-                                               y_min, y_max)
+                                               y_min, y_max, dtype)
         return GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   dtype)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray,
@@ -48,20 +51,23 @@ class GPUBackend(BaseBackend):
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> Tuple[ndarray, ndarray]:
+                                  exact: bool,
+                                  dtype: type) -> Tuple[ndarray, ndarray]:
         if exact:
             return (GPUBackend._exact_2d_render(x, y, weight_x, h, x_pixels,
                                                 y_pixels, x_min, x_max,
-                                                y_min, y_max),
+                                                y_min, y_max, dtype),
                     GPUBackend._exact_2d_render(x, y, weight_y, h, x_pixels,
                                                 y_pixels, x_min, x_max,
-                                                y_min, y_max))
+                                                y_min, y_max, dtype))
         return (GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2),
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype),
                 GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2))
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype))
 
     @staticmethod
     def interpolate_2d_line(x: ndarray,
@@ -110,14 +116,16 @@ class GPUBackend(BaseBackend):
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> ndarray:
+                                  exact: bool,
+                                  dtype: type) -> ndarray:
         if exact:
             return GPUBackend._exact_3d_project(x, y, weight, h, x_pixels,
                                                 y_pixels, x_min, x_max,
-                                                y_min, y_max)
+                                                y_min, y_max, dtype)
         return GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   dtype)
 
     @staticmethod
     def interpolate_3d_projection_vec(x: ndarray,
@@ -133,20 +141,23 @@ class GPUBackend(BaseBackend):
                                       x_max: float,
                                       y_min: float,
                                       y_max: float,
-                                      exact: bool) -> Tuple[ndarray, ndarray]:
+                                      exact: bool,
+                                      dtype: type) -> Tuple[ndarray, ndarray]:
         if exact:
             return (GPUBackend._exact_3d_project(x, y, weight_x, h, x_pixels,
                                                  y_pixels, x_min, x_max,
-                                                 y_min, y_max),
+                                                 y_min, y_max, dtype),
                     GPUBackend._exact_3d_project(x, y, weight_y, h, x_pixels,
                                                  y_pixels, x_min, x_max,
-                                                 y_min, y_max))
+                                                 y_min, y_max, dtype))
         return (GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2),
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype),
                 GPUBackend._fast_2d(x, y, np.zeros(y.size), 0, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2))
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    dtype))
 
     @staticmethod
     def interpolate_3d_cross(x: ndarray,
@@ -162,10 +173,12 @@ class GPUBackend(BaseBackend):
                              x_min: float,
                              x_max: float,
                              y_min: float,
-                             y_max: float) -> ndarray:
+                             y_max: float,
+                             dtype: type) -> ndarray:
         return GPUBackend._fast_2d(x, y, z, z_slice, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 3)
+                                   y_pixels, x_min, x_max, y_min, y_max, 3,
+                                   dtype)
 
     @staticmethod
     def interpolate_3d_cross_vec(x: ndarray,
@@ -182,13 +195,16 @@ class GPUBackend(BaseBackend):
                                  x_min: float,
                                  x_max: float,
                                  y_min: float,
-                                 y_max: float) -> Tuple[ndarray, ndarray]:
+                                 y_max: float,
+                                 dtype: type) -> Tuple[ndarray, ndarray]:
         return (GPUBackend._fast_2d(x, y, z, z_slice, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 3),
+                                    y_pixels, x_min, x_max, y_min, y_max, 3,
+                                    dtype),
                 GPUBackend._fast_2d(x, y, z, z_slice, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 3))
+                                    y_pixels, x_min, x_max, y_min, y_max, 3,
+                                    dtype))
 
     @staticmethod
     def interpolate_3d_grid(x: ndarray,
@@ -206,40 +222,44 @@ class GPUBackend(BaseBackend):
                             y_min: float,
                             y_max: float,
                             z_min: float,
-                            z_max: float) -> ndarray:
-        image = np.zeros((z_pixels, y_pixels, x_pixels))
+                            z_max: float,
+                            dtype: type) -> ndarray:
         pixwidthz = (z_max - z_min) / z_pixels
+        _2d_func = GPUBackend._fast_2d_func(weight_function)
 
-        # todo: this should be separated from _fast_2d to reduce the
-        #  unnecessary transfer of data to the graphics card.
-        for z_i in np.arange(z_pixels):
+        threadsperblock = 32
+        blockspergrid = (x.size + (threadsperblock-1)) // threadsperblock
+
+        # transfer relevant data to the GPU once, rather than once per slice
+        d_x = cuda.to_device(x)
+        d_y = cuda.to_device(y)
+        d_z = cuda.to_device(z)
+        d_w = cuda.to_device(weight)
+        d_h = cuda.to_device(h)
+        # each slice is rendered directly into its plane of the device image
+        d_image = cuda.to_device(np.zeros((z_pixels, y_pixels, x_pixels),
+                                          dtype=dtype))
+
+        for z_i in range(z_pixels):
             z_val = z_min + (z_i + 0.5) * pixwidthz
-            image[z_i] = GPUBackend._fast_2d(x, y, z, z_val, weight, h,
-                                             weight_function, kernel_radius,
-                                             x_pixels, y_pixels, x_min, x_max,
-                                             y_min, y_max, 3)
+            _2d_func[blockspergrid, threadsperblock](z_val, d_x, d_y, d_z,
+                                                     d_w, d_h, kernel_radius,
+                                                     x_pixels, y_pixels,
+                                                     x_min, x_max, y_min,
+                                                     y_max, 3, d_image[z_i])
 
-        return image
+        return d_image.copy_to_host()
 
     # For the GPU, the numba code is compiled using a factory function
     # approach. This is required since a CUDA numba kernel cannot easily take
     # weight_function as an argument.
+    # The compiled kernel is cached per weight function, so that repeated
+    # renders with the same kernel do not recompile it. Column kernels with a
+    # non-default number of samples are rebuilt on every call, so the cache is
+    # bounded to keep it from holding on to all of them.
     @staticmethod
-    def _fast_2d(x_data: ndarray,
-                 y_data: ndarray,
-                 z_data: ndarray,
-                 z_slice: float,
-                 w_data: ndarray,
-                 h_data: ndarray,
-                 weight_function: CPUDispatcher,
-                 kernel_radius: float,
-                 x_pixels: int,
-                 y_pixels: int,
-                 x_min: float,
-                 x_max: float,
-                 y_min: float,
-                 y_max: float,
-                 n_dims: int) -> ndarray:
+    @lru_cache(maxsize=8)
+    def _fast_2d_func(weight_function: CPUDispatcher) -> Callable:
         # Underlying GPU numba-compiled code for interpolation to a 2D grid.
         # Used in interpolation of 2D data, and column integration /
         # cross-sections of 3D data.
@@ -273,7 +293,11 @@ class GPUBackend(BaseBackend):
                     return
 
                 term = w_data[i] / h_data[i]**n_dims
-                rad = kernel_radius * h_data[i]
+                kernel_radius2 = kernel_radius ** 2
+
+                # radius of the kernel support within this slice, so that
+                # pixels which lie entirely outside it are never visited
+                rad = math.sqrt((kernel_radius * h_data[i])**2 - dz**2)
 
                 # determine pixels that this particle contributes to
                 ipixmin = round((x_data[i] - rad - x_min) / pixwidthx)
@@ -311,16 +335,38 @@ class GPUBackend(BaseBackend):
 
                         # calculate contributions at pixels i, j due to
                         # particle at x, y
-                        q = math.sqrt(dx2 + dy2 + dz2)
+                        q2 = dx2 + dy2 + dz2
 
-                        # add contribution to image
-                        if q < kernel_radius:
+                        # add contribution to image, only taking the square
+                        # root for pixels inside the kernel support
+                        if q2 < kernel_radius2:
                             # atomic protects against race conditions.
-                            wab = weight_function(q, n_dims)
+                            wab = weight_function(math.sqrt(q2), n_dims)
                             jp = jpix + jpixmin
                             ip = ipix + ipixmin
                             cuda.atomic.add(image, (jp, ip), term * wab)
 
+        return _2d_func
+
+    @staticmethod
+    def _fast_2d(x_data: ndarray,
+                 y_data: ndarray,
+                 z_data: ndarray,
+                 z_slice: float,
+                 w_data: ndarray,
+                 h_data: ndarray,
+                 weight_function: CPUDispatcher,
+                 kernel_radius: float,
+                 x_pixels: int,
+                 y_pixels: int,
+                 x_min: float,
+                 x_max: float,
+                 y_min: float,
+                 y_max: float,
+                 n_dims: int,
+                 dtype: type) -> ndarray:
+        _2d_func = GPUBackend._fast_2d_func(weight_function)
+
         threadsperblock = 32
         blockspergrid = (x_data.size + (threadsperblock-1)) // threadsperblock
 
@@ -332,7 +378,8 @@ class GPUBackend(BaseBackend):
         d_h = cuda.to_device(h_data)
         # CUDA kernels have no return values, so the image data must be
         # allocated on the device beforehand.
-        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels)))
+        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels),
+                                          dtype=dtype))
 
         # execute the newly compiled CUDA kernel.
         _2d_func[blockspergrid, threadsperblock](z_slice, d_x, d_y, d_z, d_w,
@@ -354,7 +401,8 @@ class GPUBackend(BaseBackend):
                          x_min: float,
                          x_max: float,
                          y_min: float,
-                         y_max: float) -> ndarray:
+                         y_max: float,
+                         dtype: type) -> ndarray:
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
 
@@ -478,7 +526,8 @@ class GPUBackend(BaseBackend):
         d_h = cuda.to_device(h_data)
         # CUDA kernels have no return values, so the image data must be
         # allocated on the device beforehand.
-        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels)))
+        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels),
+                                          dtype=dtype))
 
         # execute the newly compiled CUDA kernel.
         _2d_func[blockspergrid, threadsperblock](d_x, d_y, d_w, d_h, d_image)
@@ -697,7 +746,8 @@ class GPUBackend(BaseBackend):
                           x_min: float,
                           x_max: float,
                           y_min: float,
-                          y_max: float) -> ndarray:
+                          y_max: float,
+                          dtype: type) -> ndarray:
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
 
@@ -800,7 +850,8 @@ class GPUBackend(BaseBackend):
         d_h = cuda.to_device(h_data)
         # CUDA kernels have no return values, so the image data must be
         # allocated on the device beforehand.
-        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels)))
+        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels),
+                                          dtype=dtype))
 
         # execute the newly compiled CUDA kernel.
         _3d_func[blockspergrid, threadsperblock](d_x, d_y, d_w, d_h, d_image)
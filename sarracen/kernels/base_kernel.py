@@ -96,6 +96,11 @@ class BaseKernel:
             t = wab_index - index
             return column_kernel[index] * (1 - t) + column_kernel[index1] * t
 
+        # reusing the same dispatcher avoids recompiling every interpolation
+        # routine that the column kernel is passed to.
+        if samples == 1000:
+            self._ckernel_func_cache = func
+
         return func
 
     # Internal function for performing the integral in _get_column_kernel()
@@ -12,7 +12,7 @@ class CubicSplineKernel(BaseKernel):
         return 2
 
     @staticmethod
-    @njit(fastmath=True)
+    @njit(fastmath=True, cache=True)
     def w(q: float, ndim: int) -> float:
         norm = 2 / 3 if (ndim == 1) \
             else 10 / (7 * np.pi) if (ndim == 2) \
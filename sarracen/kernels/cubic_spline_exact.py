@@ -4,7 +4,7 @@ from numba import njit
 from typing import Tuple
 
 
-@njit
+@njit(cache=True)
 def line_int(r0: float, d1: float, d2: float, h: float) -> float:
     """ Calculate an exact 2D line integral over the cubic spline kernel.
 
@@ -55,7 +55,7 @@ def line_int(r0: float, d1: float, d2: float, h: float) -> float:
     return result
 
 
-@njit
+@njit(cache=True)
 def _full_2d_mod(phi: float, q0: float) -> float:
     """ Calculate an exact 2D line integral over the cubic spline kernel.
 
@@ -121,7 +121,7 @@ def _full_2d_mod(phi: float, q0: float) -> float:
         return _f3_2d(phi)
 
 
-@njit
+@njit(cache=True)
 def _f1_2d(phi: float, q0: float) -> float:
     """ Calculate an exact 2D line integral over the cubic spline kernel.
 
@@ -155,7 +155,7 @@ def _f1_2d(phi: float, q0: float) -> float:
         * (i2 - 0.75 * q0**2 * i4 + 0.3 * q0**3 * i5)
 
 
-@njit
+@njit(cache=True)
 def _f2_2d(phi: float, q0: float) -> float:
     """ Calculate an exact 2D line integral over the cubic spline kernel.
 
@@ -196,7 +196,7 @@ def _f2_2d(phi: float, q0: float) -> float:
             - 1. / 10. / q02 * i0)
 
 
-@njit
+@njit(cache=True)
 def _f3_2d(phi: float) -> float:
     """ Calculate an exact 2D line integral over the cubic spline kernel.
 
@@ -217,7 +217,7 @@ def _f3_2d(phi: float) -> float:
     return 0.5 / math.pi * phi
 
 
-@njit
+@njit(cache=True)
 def surface_int(r0: float,
                 x1: float,
                 y1: float,
@@ -281,7 +281,7 @@ def surface_int(r0: float,
     return result
 
 
-@njit
+@njit(cache=True)
 def _line_int3d(r0: float, r1: float, d1: float, d2: float, h: float) -> float:
     """ Calculate an exact 3D line integral over the cubic spline kernel.
 
@@ -350,7 +350,7 @@ def _line_int3d(r0: float, r1: float, d1: float, d2: float, h: float) -> float:
     return result
 
 
-@njit
+@njit(cache=True)
 def _full_integral_3d(d: float, r0: float, r1: float, h: float) -> float:
     """ Calculate an exact 3D line integral over the cubic spline kernel.
 
@@ -454,7 +454,7 @@ def _full_integral_3d(d: float, r0: float, r1: float, h: float) -> float:
         return r0h3 / math.pi * (-0.25 * r0h_3 * i[1] + b3 / r03 * i[0] + d3)
 
 
-@njit
+@njit(cache=True)
 def get_I_terms(cosp: float,
                 a2: float,
                 a: float) -> Tuple[float, float, float, float, float, float]:
@@ -12,7 +12,7 @@ class QuarticSplineKernel(BaseKernel):
         return 2.5
 
     @staticmethod
-    @njit(fastmath=True)
+    @njit(fastmath=True, cache=True)
     def w(q: float, ndim: int) -> float:
         norm = 1 / 24 if (ndim == 1) \
             else 96 / (1199 * np.pi) if (ndim == 2) \
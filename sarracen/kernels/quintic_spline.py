@@ -12,7 +12,7 @@ class QuinticSplineKernel(BaseKernel):
         return 3
 
     @staticmethod
-    @njit(fastmath=True)
+    @njit(fastmath=True, cache=True)
     def w(q: float, ndim: int) -> float:
         norm = 1 / 120 if (ndim == 1) \
             else 7 / (478 * np.pi) if (ndim == 2) \
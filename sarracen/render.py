@@ -296,13 +296,14 @@ def render(data: 'SarracenDataFrame',  # noqa: F821
 
     which uses the integral of the kernel along the chosen line of sight.
     """
-    if data.get_dim() == 2:
+    dim = data.get_dim()
+    if dim == 2:
         if dens_weight is None:
             dens_weight = False
         img = interpolate_2d(data, target, x, y, kernel, x_pixels, y_pixels,
                              xlim, ylim, exact, backend, dens_weight,
                              normalize, hmin)
-    elif data.get_dim() == 3:
+    elif dim == 3:
         if xsec is not None:
             if dens_weight is None:
                 dens_weight = False
@@ -346,7 +347,7 @@ def render(data: 'SarracenDataFrame',  # noqa: F821
         kwargs.pop("vmax", None)
 
     graphic = ax.imshow(img, cmap=cmap, **kwargs)
-    if rotation is not None and data.get_dim() == 3:
+    if rotation is not None and dim == 3:
         if corotation is not None:
             ax.set_xlabel(x)
             ax.set_ylabel(y)
@@ -358,7 +359,7 @@ def render(data: 'SarracenDataFrame',  # noqa: F821
         colorbar = ax.figure.colorbar(graphic, cbar_ax, ax, **cbar_kws)
         if 'label' not in cbar_kws:
             label = target
-            if data.get_dim() == 3 and xsec is None:
+            if dim == 3 and xsec is None:
                 label = f"column {label}"
             if log_scale:
                 label = f"log ({label})"
@@ -439,7 +440,8 @@ def lineplot(data: 'SarracenDataFrame',  # noqa: F821
         not exist in `data`.
     """
 
-    if data.get_dim() == 2:
+    dim = data.get_dim()
+    if dim == 2:
         img = interpolate_2d_line(data, target, x, y, kernel, pixels, xlim,
                                   ylim, backend, dens_weight, normalize, hmin)
     else:
@@ -455,7 +457,7 @@ def lineplot(data: 'SarracenDataFrame',  # noqa: F821
     x, y = _default_axes(data, x, y)
     xlim, ylim = _default_bounds(data, x, y, xlim, ylim)
 
-    if data.get_dim() == 2:
+    if dim == 2:
         upper_lim = np.sqrt((xlim[1] - xlim[0])**2 + (ylim[1] - ylim[0])**2)
     else:
         if z is None:
@@ -484,7 +486,7 @@ def lineplot(data: 'SarracenDataFrame',  # noqa: F821
 
     ax.margins(x=0, y=0)
 
-    label = f'({x}, {y})' if data.get_dim() == 2 else f'({x}, {y}, {z})'
+    label = f'({x}, {y})' if dim == 2 else f'({x}, {y}, {z})'
     ax.set_xlabel('cross-section ' + label)
 
     label = target
@@ -599,7 +601,8 @@ def streamlines(data: 'SarracenDataFrame',  # noqa: F821
     """
     # Choose between the various interpolation functions available, based on
     # initial data passed to this function.
-    if data.get_dim() == 2:
+    dim = data.get_dim()
+    if dim == 2:
         if not len(target) == 2:
             raise ValueError('Target vector is not 2-dimensional.')
         if dens_weight is None:
@@ -607,7 +610,7 @@ def streamlines(data: 'SarracenDataFrame',  # noqa: F821
         img = interpolate_2d_vec(data, target[0], target[1], x, y, kernel,
                                  x_pixels, y_pixels, xlim, ylim, exact,
                                  backend, dens_weight, normalize, hmin)
-    elif data.get_dim() == 3:
+    elif dim == 3:
         if not len(target) == 3:
             raise ValueError('Target vector is not 3-dimensional.')
         if xsec is not None:
@@ -764,7 +767,8 @@ def arrowplot(data: 'SarracenDataFrame',  # noqa: F821
     xlim, ylim = _default_bounds(data, x, y, xlim, ylim)
     x_arrows, y_arrows = _set_pixels(x_arrows, y_arrows, xlim, ylim, 20)
 
-    if data.get_dim() == 2:
+    dim = data.get_dim()
+    if dim == 2:
         if not len(target) == 2:
             raise ValueError('Target vector is not 2-dimensional.')
         if dens_weight is None:
@@ -772,7 +776,7 @@ def arrowplot(data: 'SarracenDataFrame',  # noqa: F821
         img = interpolate_2d_vec(data, target[0], target[1], x, y, kernel,
                                  x_arrows, y_arrows, xlim, ylim, exact,
                                  backend, dens_weight, normalize, hmin)
-    elif data.get_dim() == 3:
+    elif dim == 3:
         if not len(target) == 3:
             raise ValueError('Target vector is not 3-dimensional.')
         if xsec is not None:
@@ -1,16 +1,26 @@
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Type, Union, Callable, Tuple, Optional, Dict
 
 from matplotlib.axes import Axes
 from matplotlib.colors import Colormap
 import pandas as pd
 from pandas import DataFrame, Series
-from numba import cuda
 import numpy as np
 from scipy.spatial.transform import Rotation
 
 from .render import streamlines, arrowplot, render, lineplot
 from .interpolate import interpolate_2d, interpolate_3d_grid
+from .interpolate.interpolate import _check_dtype
 from .kernels import CubicSplineKernel, BaseKernel
+from ._density import _calc_density
+
+
+@lru_cache(maxsize=1)
+def _default_backend() -> str:
+    """Probe for a CUDA device once per process and pick a backend."""
+    from numba import cuda
+    return 'gpu' if cuda.is_available() else 'cpu'
 
 
 def _copy_doc(copy_func: Callable) -> Callable:
@@ -111,7 +121,8 @@ class SarracenDataFrame(DataFrame):
         self._params = dict(params or {})
 
         self._units = None
-        self.units = Series([np.nan for _ in range(len(self.columns))])
+        self.units = Series(np.full(len(self.columns), np.nan),
+                            index=self.columns)
 
         self._xcol, self._ycol, self._zcol = None, None, None
         self._hcol, self._mcol, self._rhocol = None, None, None
@@ -121,7 +132,7 @@ class SarracenDataFrame(DataFrame):
         self._identify_special_columns()
 
         self._kernel = CubicSplineKernel()
-        self._backend = 'gpu' if cuda.is_available() else 'cpu'
+        self._backend = _default_backend()
 
     @property
     def _constructor(self) -> Type:
@@ -143,56 +154,60 @@ class SarracenDataFrame(DataFrame):
         columns cannot be sound, the corresponding column label is set to
         `None`.
         """
+        # Membership is checked against a set built once, and labels are
+        # written directly since they are known to exist.
+        columns = set(self.columns)
+
         # First look for 'x', then 'rx', and then default to the first column.
-        if 'x' in self.columns:
-            self.xcol = 'x'
-        elif 'rx' in self.columns:
-            self.xcol = 'rx'
+        if 'x' in columns:
+            self._xcol = 'x'
+        elif 'rx' in columns:
+            self._xcol = 'rx'
         elif len(self.columns) > 0:
-            self.xcol = self.columns[0]
+            self._xcol = self.columns[0]
 
         # First look for 'y', then 'ry', and then default to the second column.
-        if 'y' in self.columns:
-            self.ycol = 'y'
-        elif 'ry' in self.columns:
-            self.ycol = 'ry'
+        if 'y' in columns:
+            self._ycol = 'y'
+        elif 'ry' in columns:
+            self._ycol = 'ry'
         elif len(self.columns) > 1:
-            self.ycol = self.columns[1]
+            self._ycol = self.columns[1]
 
         # First look for 'z', then 'rz', and then assume data is 2-dimensional.
-        if 'z' in self.columns:
-            self.zcol = 'z'
-        elif 'rz' in self.columns:
-            self.zcol = 'rz'
+        if 'z' in columns:
+            self._zcol = 'z'
+        elif 'rz' in columns:
+            self._zcol = 'rz'
 
         # Look for the keyword 'h' in the data.
-        if 'h' in self.columns:
-            self.hcol = 'h'
+        if 'h' in columns:
+            self._hcol = 'h'
 
         # Look for the keyword 'm' or 'mass' in the data.
-        if 'm' in self.columns:
-            self.mcol = 'm'
-        elif 'mass' in self.columns:
-            self.mcol = 'mass'
+        if 'm' in columns:
+            self._mcol = 'm'
+        elif 'mass' in columns:
+            self._mcol = 'mass'
 
         # Look for the keyword 'rho' or 'density' in the data.
-        if 'rho' in self.columns:
-            self.rhocol = 'rho'
-        elif 'density' in self.columns:
-            self.rhocol = 'density'
+        if 'rho' in columns:
+            self._rhocol = 'rho'
+        elif 'density' in columns:
+            self._rhocol = 'density'
 
         # Look for the keyword 'rho' or 'density' in the data.
-        if 'vx' in self.columns:
-            self.vxcol = 'vx'
-        if 'vy' in self.columns:
-            self.vycol = 'vy'
-        if 'vz' in self.columns:
-            self.vzcol = 'vz'
+        if 'vx' in columns:
+            self._vxcol = 'vx'
+        if 'vy' in columns:
+            self._vycol = 'vy'
+        if 'vz' in columns:
+            self._vzcol = 'vz'
 
         # Look for the keyword 'dustfrac' in the data.
-        for column in self.columns:
-            if column.startswith('dustfrac'):
-                self.dustfracscol.append(column)
+        self._dustfracscol.extend(
+            column for column in self.columns
+            if isinstance(column, str) and column.startswith('dustfrac'))
 
     def create_mass_column(self) -> None:
         """
@@ -235,7 +250,7 @@ class SarracenDataFrame(DataFrame):
             If the `hcol` column does not exist, there is no `mcol` column or
             `mass` in params, or if `hfact` does not exist in `params`.
         """
-        if not {self.hcol}.issubset(self.columns):
+        if self.hcol not in self.columns:
             raise KeyError('Missing smoothing length data in this '
                            'SarracenDataFrame')
         if self.params is None or 'hfact' not in self.params:
@@ -246,14 +261,16 @@ class SarracenDataFrame(DataFrame):
             raise KeyError('Missing particle mass data in this '
                            'SarracenDataFrame.')
 
+        h = self[self.hcol].to_numpy()
+
         # prioritize using mass per particle, if present
-        if {self.mcol}.issubset(self.columns):
-            mass = self[self.mcol]
+        if self.mcol in self.columns:
+            mass = self[self.mcol].to_numpy()
         else:
             mass = self.params['mass']
 
-        hfact = self.params['hfact']
-        self['rho'] = mass * (hfact / self[self.hcol])**self.get_dim()
+        self['rho'] = _calc_density(h, mass, self.params['hfact'],
+                                    self.get_dim())
         self.rhocol = 'rho'
 
     def calc_one_fluid_quantities(self) -> None:
@@ -269,51 +286,55 @@ class SarracenDataFrame(DataFrame):
         ValueError
             If `ndustsmall` is zero or `ndustlarge` is non zero.
         """
-        if not {self.dustfracscol[0]}.issubset(self.columns):
+        if self.dustfracscol[0] not in self.columns:
             raise KeyError('Missing dust fraction data in this '
                            'SarracenDataFrame')
         # use self[self.dustfrac], check if columns exist
-        if not {self.rhocol}.issubset(self.columns):
+        if self.rhocol not in self.columns:
             self.calc_density()
 
-        if (int(self.params['ndustsmall']) == 0 or
-                int(self.params['ndustlarge']) != 0):
+        ndustsmall = int(self.params['ndustsmall'])
+        ndustlarge = int(self.params['ndustlarge'])
+
+        if ndustsmall == 0 or ndustlarge != 0:
             raise ValueError('Not a one-fluid-only dump.')
         else:
-            if int(self.params['ndustsmall']) == 1:
+            if ndustsmall == 1:
                 self['rho_g'] = self['rho'] * self['dustfrac']
                 self['rho_d'] = self['rho'] * (1 - self['dustfrac'])
                 self['dtg'] = self['rho_d'] / self['rho_g']
             else:
-                self['dustfrac_total'] = self[self.dustfracscol].sum(axis=1)
-                self['rho_g'] = self['rho'] * (1 - self['dustfrac_total'])
-                self['rho_d_total'] = self['rho'] * self['dustfrac_total']
-                self['rho_d'] = self['rho'] * self[self.dustfracscol[0]]
-                for i in range(1, int(self.params['ndustsmall'])):
-                    self[f'rho_d_{i+1}'] = self['rho'] * \
-                                                    self[self.dustfracscol[i]]
-                self['dtg'] = self['dustfrac_total'] / (1 -
-                                                        self['dustfrac_total'])
+                # compute every column from plain arrays, rather than from
+                # intermediate Series aligned on the index
+                rho = self['rho'].to_numpy()
+                dustfrac = self._stack_columns(self.dustfracscol)
+                dustfrac_total = dustfrac.sum(axis=1)
+
+                columns = {'dustfrac_total': dustfrac_total,
+                           'rho_g': rho * (1 - dustfrac_total),
+                           'rho_d_total': rho * dustfrac_total,
+                           'rho_d': rho * dustfrac[:, 0]}
+                for i in range(1, ndustsmall):
+                    columns[f'rho_d_{i+1}'] = rho * dustfrac[:, i]
+                columns['dtg'] = dustfrac_total / (1 - dustfrac_total)
+
+                for name, values in columns.items():
+                    self[name] = values
 
     def centre_of_mass(self) -> list:
         """
         Returns the centre of mass of the data.
         """
-        if {self.mcol}.issubset(self.columns):
-            mass = self[self.mcol]
-        else:
-            mass = self.params['mass']
-
-        com_x = (self[self.xcol] * mass).sum()
-        com_y = (self[self.ycol] * mass).sum()
-        com_z = (self[self.zcol] * mass).sum()
+        pos = self._positions()
 
-        if isinstance(mass, pd.Series):
-            inv_mass = 1.0 / mass.sum()
+        if self.mcol in self.columns:
+            mass = self[self.mcol].to_numpy(np.float64)
+            com = (mass @ pos) / mass.sum()
         else:
-            inv_mass = 1.0 / (len(self) * mass)
+            # with equal mass particles, the mass cancels out
+            com = pos.sum(axis=0) / len(self)
 
-        return [com_x * inv_mass, com_y * inv_mass, com_z * inv_mass]
+        return com.tolist()
 
     def classify_sink(self, sdf_sinks: Type) -> None:
         """
@@ -322,40 +343,36 @@ class SarracenDataFrame(DataFrame):
         Creates a new column 'sink' that classifies particles by the sink they
         are bound to, or -1 if they are not bound to any sink.
         """
-        # calculate the energy of particles relative to each sink
-        v = np.array([self[self.vxcol], self[self.vycol], self[self.vzcol]]).T
-        for index, sink in sdf_sinks.iterrows():
-
-            # kinetic energy
-            v_sink = np.array([sink[sdf_sinks.vxcol],
-                               sink[sdf_sinks.vycol],
-                               sink[sdf_sinks.vzcol]])
-            v_rel = np.linalg.norm(v-v_sink, axis=1)
-            if {self.mcol}.issubset(self.columns):
-                mass = self[self.mcol]
-            else:
-                if self.params is None or 'mass' not in self.params:
-                    raise KeyError("'mass' value does not exist in this "
-                                   "SarracenDataFrame.")
-                mass = self.params['mass']
-            E_k = 0.5 * mass * v_rel**2
-
-            # potential energy
-            rel_pos = self[[self.xcol, self.ycol, self.zcol]] - sdf_sinks[
-                [sdf_sinks.xcol, sdf_sinks.ycol, sdf_sinks.zcol]].loc[index]
-            r = np.linalg.norm(rel_pos, axis=1)
-            E_pot = -sink[sdf_sinks.mcol] * mass / r
-
-            self[f"E_{index}"] = E_k + E_pot
-
-        # classify particles by sink they are bound to
-        energies = np.array([[self[f"E_{index}"]]
-                            for index in sdf_sinks.index])
-        self["sink"] = np.argmin(energies, axis=0)[0, :]
+        if self.mcol in self.columns:
+            mass = self[self.mcol].to_numpy()
+        else:
+            if self.params is None or 'mass' not in self.params:
+                raise KeyError("'mass' value does not exist in this "
+                               "SarracenDataFrame.")
+            mass = self.params['mass']
 
-        # identify particles not bound to any sink
-        unbound = pd.Series((energies.min(axis=0) > 0)[0, :], index=self.index)
-        self.loc[unbound[unbound].index, "sink"] = -1
+        pos = self._positions()
+        vel = self._velocities()
+        sink_pos = sdf_sinks._positions()
+        sink_vel = sdf_sinks._velocities()
+        sink_mass = sdf_sinks[sdf_sinks.mcol].to_numpy()
+
+        # calculate the energy of particles relative to each sink at once,
+        # with one row per sink and one column per particle
+        dv = vel[np.newaxis, :, :] - sink_vel[:, np.newaxis, :]
+        dr = pos[np.newaxis, :, :] - sink_pos[:, np.newaxis, :]
+        v_rel2 = np.einsum('sij,sij->si', dv, dv)
+        r = np.sqrt(np.einsum('sij,sij->si', dr, dr))
+        energies = 0.5 * mass * v_rel2 - sink_mass[:, np.newaxis] * mass / r
+
+        for index, energy in zip(sdf_sinks.index, energies):
+            self[f"E_{index}"] = energy
+
+        # classify particles by sink they are bound to, or -1 for particles
+        # not bound to any sink
+        sink = np.argmin(energies, axis=0)
+        min_energy = np.take_along_axis(energies, sink[np.newaxis, :], axis=0)
+        self["sink"] = np.where(min_energy[0] > 0, -1, sink).astype(np.int32)
 
     @_copy_doc(render)
     def render(self,
@@ -490,7 +507,8 @@ class SarracenDataFrame(DataFrame):
                         backend: str = 'cpu',
                         dens_weight: bool = False,
                         normalize: bool = False,
-                        hmin: bool = False) -> np.ndarray:
+                        hmin: bool = False,
+                        dtype: type = np.float64) -> np.ndarray:
         """
         Interpolate this data to a 2D or 3D grid, depending on the
         dimensionality of the data.
@@ -540,6 +558,12 @@ class SarracenDataFrame(DataFrame):
             imposed. This ensures each particle contributes to at least one
             grid cell / pixel. Defaults to False (this may change in a future
             verison).
+        dtype: data-type, optional
+            Floating point type of the output image, to which the particle
+            data is also converted before interpolating. Passing
+            ``np.float32`` halves the memory traffic of the interpolation,
+            which mostly benefits the 'gpu' backend. Defaults to
+            ``np.float64``.
 
         Returns
         -------
@@ -554,25 +578,27 @@ class SarracenDataFrame(DataFrame):
         ValueError
             If `x_pixels`, `y_pixels` or `z_pixels` are less than or equal to
             zero, or if the specified `x`, `y` and `z` minimum and maximum
-            values result in an invalid region, or if `data` is not 2 or
-            3-dimensional.
+            values result in an invalid region, if `data` is not 2 or
+            3-dimensional, or if `dtype` is not a floating point type.
         KeyError
             If `target`, `x`, `y`, `z`, mass, density, or smoothing length
             columns do not exist in `data`.
         """
-        if self.get_dim() == 2:
+        dtype = _check_dtype(dtype)
+        dim = self.get_dim()
+        if dim == 2:
             if xlim is None:
                 xlim = (None, None)
             if ylim is None:
                 ylim = (None, None)
             return interpolate_2d(self, target, x, y, kernel, x_pixels,
                                   y_pixels, xlim, ylim, exact, backend,
-                                  dens_weight, normalize, hmin)
-        elif self.get_dim() == 3:
+                                  dens_weight, normalize, hmin, dtype)
+        elif dim == 3:
             return interpolate_3d_grid(self, target, x, y, z, kernel, rotation,
                                        rot_origin, x_pixels, y_pixels,
                                        z_pixels, xlim, ylim, zlim, backend,
-                                       dens_weight, normalize, hmin)
+                                       dens_weight, normalize, hmin, dtype)
         raise ValueError('Invalid number of dimensions.')
 
     @property
@@ -580,16 +606,19 @@ class SarracenDataFrame(DataFrame):
         """
         dict: Miscellaneous dataset-level parameters.
 
+        Any mapping (e.g. an OrderedDict or MappingProxyType) may be assigned,
+        and is stored as a copy in a standard dictionary.
+
         Raises
         ------
         TypeError
-            If `params` is set to a non-dictionary or non-None object.
+            If `params` is set to a non-mapping or non-None object.
         """
         return self._params
 
     @params.setter
-    def params(self, new_params: Union[Dict[str, Any], None]) -> None:
-        if new_params is not None and not isinstance(new_params, dict):
+    def params(self, new_params: Union[Mapping[str, Any], None]) -> None:
+        if new_params is not None and not isinstance(new_params, Mapping):
             raise TypeError("Parameters not a dictionary")
         self._params = dict(new_params or {})
 
@@ -614,7 +643,7 @@ class SarracenDataFrame(DataFrame):
 
     @xcol.setter
     def xcol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._xcol = new_col
 
     @property
@@ -629,7 +658,7 @@ class SarracenDataFrame(DataFrame):
 
     @ycol.setter
     def ycol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._ycol = new_col
 
     @property
@@ -644,7 +673,7 @@ class SarracenDataFrame(DataFrame):
 
     @zcol.setter
     def zcol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._zcol = new_col
 
     @property
@@ -659,7 +688,7 @@ class SarracenDataFrame(DataFrame):
 
     @hcol.setter
     def hcol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._hcol = new_col
 
     @property
@@ -674,7 +703,7 @@ class SarracenDataFrame(DataFrame):
 
     @mcol.setter
     def mcol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._mcol = new_col
 
     @property
@@ -689,7 +718,7 @@ class SarracenDataFrame(DataFrame):
 
     @rhocol.setter
     def rhocol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._rhocol = new_col
 
     @property
@@ -705,7 +734,7 @@ class SarracenDataFrame(DataFrame):
 
     @vxcol.setter
     def vxcol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._vxcol = new_col
 
     @property
@@ -721,7 +750,7 @@ class SarracenDataFrame(DataFrame):
 
     @vycol.setter
     def vycol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._vycol = new_col
 
     @property
@@ -737,7 +766,7 @@ class SarracenDataFrame(DataFrame):
 
     @vzcol.setter
     def vzcol(self, new_col: Union[str, None]) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._vzcol = new_col
 
     @property
@@ -746,7 +775,7 @@ class SarracenDataFrame(DataFrame):
 
     @dustfracscol.setter
     def dustfracscol(self, new_col: str) -> None:
-        if new_col in self or new_col is None:
+        if new_col is None or new_col in self.columns:
             self._dustfracscol = new_col
 
     @property
@@ -790,3 +819,24 @@ class SarracenDataFrame(DataFrame):
             The number of positional dimensions.
         """
         return 3 if self.zcol is not None else 2
+
+    def _stack_columns(self, columns: list) -> np.ndarray:
+        """
+        Gather columns into a single (N, len(columns)) array.
+
+        Each column is copied straight into a preallocated column-major
+        buffer, which keeps every column contiguous in memory and avoids
+        building an intermediate SarracenDataFrame as ``self[columns]`` would.
+        """
+        stacked = np.empty((len(self), len(columns)), order='F')
+        for i, column in enumerate(columns):
+            stacked[:, i] = self[column].to_numpy()
+        return stacked
+
+    def _positions(self) -> np.ndarray:
+        """Particle positions as an (N, 3) array."""
+        return self._stack_columns([self.xcol, self.ycol, self.zcol])
+
+    def _velocities(self) -> np.ndarray:
+        """Particle velocities as an (N, 3) array."""
+        return self._stack_columns([self.vxcol, self.vycol, self.vzcol])
@@ -1561,3 +1561,40 @@ def test_minimum_smoothing_length_1d_lines(backend: str) -> None:
                                     normalize=False, hmin=True)
 
     assert (grid == grid_hmin).all()
+
+
+@mark.parametrize("backend", backends)
+@mark.parametrize("exact", [False, True])
+def test_single_precision_render(backend: str, exact: bool) -> None:
+    """
+    Images should be accumulated in double precision unless single precision
+    is explicitly requested, regardless of the precision of the particle data.
+    """
+    data = {'x': [-0.5, 0.5], 'y': [0.5, -0.5], 'A': [2, 1.5],
+            'h': [1.1, 1.3], 'rho': [0.55, 0.45], 'm': [0.04, 0.05]}
+    sdf = SarracenDataFrame(data, params=dict())
+    sdf.backend = backend
+    sdf32 = SarracenDataFrame(sdf.astype(np.float32), params=dict())
+    sdf32.backend = backend
+
+    img = interpolate_2d(sdf, 'A', x_pixels=20, y_pixels=20, exact=exact,
+                         normalize=False, hmin=False)
+    img_data32 = interpolate_2d(sdf32, 'A', x_pixels=20, y_pixels=20,
+                                exact=exact, normalize=False, hmin=False)
+    img32 = interpolate_2d(sdf, 'A', x_pixels=20, y_pixels=20, exact=exact,
+                           normalize=False, hmin=False, dtype=np.float32)
+    img_str32 = interpolate_2d(sdf, 'A', x_pixels=20, y_pixels=20,
+                               exact=exact, normalize=False, hmin=False,
+                               dtype='float32')
+
+    assert img.dtype == np.float64
+    assert img_data32.dtype == np.float64
+    assert img32.dtype == np.float32
+    assert img_str32.dtype == np.float32
+    assert_allclose(img_data32, img, rtol=1e-5, atol=1e-7)
+    assert_allclose(img32, img, rtol=1e-5, atol=1e-7)
+    assert_allclose(img_str32, img32)
+
+    with raises(ValueError):
+        interpolate_2d(sdf, 'A', x_pixels=20, y_pixels=20, exact=exact,
+                       dtype=np.int32)
@@ -191,3 +191,12 @@ def test_oob(kernel: BaseKernel) -> None:
     column_func = kernel.get_column_kernel_func(1000)
     assert column_func(-1, 0) == column_func(0, 0)
     assert approx(column_func(kernel.get_radius() + 1, 0)) == 0
+
+
+@mark.parametrize("kernel",
+                  [CubicSplineKernel(),
+                   QuarticSplineKernel(),
+                   QuinticSplineKernel()])
+def test_column_func_cache(kernel: BaseKernel) -> None:
+    column_func = kernel.get_column_kernel_func(1000)
+    assert kernel.get_column_kernel_func(1000) is column_func
@@ -1,6 +1,10 @@
 """pytest unit tests for sarracen_dataframe.py functionality."""
+from collections import OrderedDict
+from types import MappingProxyType
+
 import numpy as np
 from matplotlib import pyplot as plt
+from pytest import approx, raises
 
 from sarracen import SarracenDataFrame, render
 
@@ -153,6 +157,27 @@ def test_render_passthrough() -> None:
     assert repr(ax1) == repr(ax2)
 
 
+def test_params_mapping() -> None:
+    """ Any mapping may be used as params, but is stored as a plain dict. """
+    sdf = SarracenDataFrame(data={'x': [0, 1], 'y': [1, 0]})
+
+    sdf.params = OrderedDict([('mass', 0.1), ('hfact', 1.2)])
+    assert type(sdf.params) is dict
+    assert sdf.params == {'mass': 0.1, 'hfact': 1.2}
+
+    source = {'mass': 0.2}
+    sdf.params = MappingProxyType(source)
+    assert type(sdf.params) is dict
+    assert sdf.params == {'mass': 0.2}
+
+    # the stored parameters are a copy, which can be modified freely
+    sdf.params['hfact'] = 1.0
+    assert source == {'mass': 0.2}
+
+    with raises(TypeError):
+        sdf.params = [('mass', 0.1)]
+
+
 def test_calc_density() -> None:
     # Tests that the density calculation is working as intended.
 
@@ -166,8 +191,8 @@ def test_calc_density() -> None:
     rho_0 = sdf.params['mass'] * (sdf.params['hfact'] / sdf['h'][0])**2
     rho_1 = sdf.params['mass'] * (sdf.params['hfact'] / sdf['h'][1])**2
 
-    assert sdf['rho'][0] == rho_0
-    assert sdf['rho'][1] == rho_1
+    assert sdf['rho'][0] == approx(rho_0)
+    assert sdf['rho'][1] == approx(rho_1)
 
     # 3D Data
     data = {'x': [3, 6], 'y': [5, 1], 'z': [2, 1], 'h': [0.0234, 7.3452]}
@@ -179,8 +204,8 @@ def test_calc_density() -> None:
     rho_0 = sdf.params['mass'] * (sdf.params['hfact'] / sdf['h'][0])**3
     rho_1 = sdf.params['mass'] * (sdf.params['hfact'] / sdf['h'][1])**3
 
-    assert sdf['rho'][0] == rho_0
-    assert sdf['rho'][1] == rho_1
+    assert sdf['rho'][0] == approx(rho_0)
+    assert sdf['rho'][1] == approx(rho_1)
 
 
 def test_centre_of_mass() -> None:
@@ -200,3 +225,72 @@ def test_centre_of_mass() -> None:
                             params={'mass': 3.2e-4})
 
     assert sdf.centre_of_mass() == [0.0, 0.0, 0.0]
+
+
+def test_classify_sink() -> None:
+    """ Particles are assigned to the sink they are most strongly bound to. """
+    sdf = SarracenDataFrame(data={'x': [1, 0, 10], 'y': [0, 2, 0],
+                                  'z': [0, 0, 0], 'vx': [0, 0, 0],
+                                  'vy': [0, 0, 10], 'vz': [0, 0, 0]},
+                            params={'mass': 0.5})
+    sinks = SarracenDataFrame(data={'x': [0, 0], 'y': [0, 3], 'z': [0, 0],
+                                    'vx': [0, 0], 'vy': [0, 0], 'vz': [0, 0],
+                                    'm': [2, 4]},
+                              params={}, index=[3, 8])
+
+    sdf.classify_sink(sinks)
+
+    # E = m v^2 / 2 - M m / r for each particle relative to each sink
+    assert sdf['E_3'].to_numpy() == approx([-1, -0.5, 25 - 0.1])
+    assert sdf['E_8'].to_numpy() == approx([-2 / np.sqrt(10), -2,
+                                            25 - 2 / np.sqrt(109)])
+    # the third particle is moving fast enough to escape both sinks
+    assert list(sdf['sink']) == [0, 1, -1]
+
+
+def test_calc_one_fluid_quantities() -> None:
+    """ Gas and dust densities for a dump with several small grain sizes. """
+    data = {'x': [0.1, 0.5, 0.9], 'y': [0.2, 0.4, 0.6], 'z': [0, 0.3, 0.7],
+            'h': [0.1, 0.2, 0.3], 'rho': [2.0, 1.5, 0.5],
+            'dustfrac1': [0.01, 0.1, 0.2],
+            'dustfrac2': [0.02, 0.05, 0.3],
+            'dustfrac3': [0.03, 0.15, 0.1]}
+    params = {'mass': 1e-3, 'hfact': 1.2, 'ndustsmall': 3, 'ndustlarge': 0}
+    sdf = SarracenDataFrame(data, params)
+
+    sdf.calc_one_fluid_quantities()
+
+    rho = np.array([2.0, 1.5, 0.5])
+    eps = np.array([[0.01, 0.02, 0.03],
+                    [0.1, 0.05, 0.15],
+                    [0.2, 0.3, 0.1]])
+    eps_total = np.array([0.06, 0.3, 0.6])
+
+    assert np.allclose(sdf['dustfrac_total'], eps_total)
+    assert np.allclose(sdf['rho_g'], rho * (1 - eps_total))
+    assert np.allclose(sdf['rho_d_total'], rho * eps_total)
+    assert np.allclose(sdf['rho_d'], rho * eps[:, 0])
+    assert np.allclose(sdf['rho_d_2'], rho * eps[:, 1])
+    assert np.allclose(sdf['rho_d_3'], rho * eps[:, 2])
+    assert np.allclose(sdf['dtg'], eps_total / (1 - eps_total))
+    assert 'rho_d_4' not in sdf.columns
+
+
+def test_single_precision_interpolate() -> None:
+    """ Interpolating in single precision should closely match double. """
+    rng = np.random.default_rng(seed=3)
+    sdf = SarracenDataFrame(data={'x': rng.random(200),
+                                  'y': rng.random(200),
+                                  'z': rng.random(200),
+                                  'h': rng.random(200) * 0.2 + 0.1,
+                                  'rho': rng.random(200) + 0.5},
+                            params={'mass': 0.01, 'hfact': 1.2})
+
+    image64 = sdf.sph_interpolate('rho', x_pixels=8, y_pixels=8, z_pixels=8)
+    image32 = sdf.sph_interpolate('rho', x_pixels=8, y_pixels=8, z_pixels=8,
+                                  dtype=np.float32)
+
+    assert sdf['rho'].dtype == np.float64
+    assert image64.dtype == np.float64
+    assert image32.dtype == np.float32
+    assert np.allclose(image32, image64, rtol=1e-4)